@@ -1,394 +1,547 @@
-from flask import Flask, render_template, request, jsonify, session
-from cli_integration import NockchainWalletCLI, NockchainCLIError, nicks_to_nock, nock_to_nicks, parse_list_active_addresses
+from quart import Quart, render_template, request
+from werkzeug.exceptions import HTTPException
+from cli_integration import NockchainWalletCLI, NockchainCLIError, nock_to_nicks, parse_list_active_addresses
+from notes_store import NotesStore
+import asyncio
+import hashlib
+import msgspec
+import orjson
 import os
-from datetime import datetime
+import re
+import time
 
-app = Flask(__name__)
+app = Quart(__name__)
 app.secret_key = os.environ.get("SECRET_KEY", "dev-secret-key-change-in-production")
 
 # Initialize CLI wrapper
 cli = NockchainWalletCLI()
 
+# Local SQLite copy of parsed notes (WAL mode); serves the transactions
+# page instantly and keeps working when the CLI/node is down
+notes_store = NotesStore(os.environ.get("KNOX_NOTES_DB", "notes_cache.db"))
+
+# Nockchain addresses are base58-style alphanumeric strings; reject anything
+# else before spending a float parse and two subprocess calls on it
+ADDR_RE = re.compile(r"^[A-Za-z0-9]{10,128}$")
+
+
+def error_response(message, status=400):
+    """Shared validation-failure payload used by the POST endpoints."""
+    return ojson({"success": False, "error": message}, status)
+
+
+def ojson(obj, status=200):
+    """JSON response via orjson, which serializes large note lists far faster
+    than the stdlib encoder behind jsonify."""
+    return app.response_class(orjson.dumps(obj), status=status, mimetype="application/json")
+
+
+def ojson_cached(obj, max_age=2):
+    """JSON response with ETag/Cache-Control for polled read-only endpoints.
+
+    When the frontend re-polls with If-None-Match and the payload hasn't
+    changed, answer 304 with an empty body instead of re-sending it.
+    """
+    return _etag_response(orjson.dumps(obj), max_age)
+
+
+def _etag_response(body, max_age=2):
+    etag = hashlib.blake2b(body, digest_size=8).hexdigest()
+    if request.headers.get("If-None-Match") == etag:
+        resp = app.response_class(b"", status=304)
+    else:
+        resp = app.response_class(body, mimetype="application/json")
+    resp.headers["ETag"] = etag
+    resp.headers["Cache-Control"] = f"private, max-age={max_age}"
+    return resp
+
+
+class BalanceResponse(msgspec.Struct):
+    """Fixed-shape payload for the balance endpoints.
+
+    Encoding a Struct with the shared msgspec encoder skips the per-request
+    dict construction the other handlers pay.
+    """
+
+    success: bool
+    address: str
+    balance_nock: float
+    balance_nicks: int
+    block_height: str
+    num_notes: int
+    version: str = ""
+
+
+_balance_encoder = msgspec.json.Encoder()
+
+
+class CLICache:
+    """Small in-process TTL cache for read-only CLI lookups.
+
+    Dashboard polling hits the same handful of commands every few seconds;
+    caching their results for a short window collapses bursts of requests
+    into a single subprocess spawn. A per-key lock ensures concurrent
+    requests for the same key wait for one fetch instead of piling on.
+    """
+
+    def __init__(self, ttl: float = 3.0):
+        self.ttl = ttl
+        self._entries = {}
+        self._locks = {}
+
+    async def get(self, key, fetch):
+        """Return the cached value for key, or run fetch in a thread and cache it."""
+        entry = self._entries.get(key)
+        if entry and entry[0] > time.monotonic():
+            return entry[1]
+
+        lock = self._locks.setdefault(key, asyncio.Lock())
+        async with lock:
+            # Re-check: another request may have refreshed while we waited
+            entry = self._entries.get(key)
+            if entry and entry[0] > time.monotonic():
+                return entry[1]
+
+            value = await asyncio.to_thread(fetch)
+            self._entries[key] = (time.monotonic() + self.ttl, value)
+            return value
+
+    def invalidate(self):
+        """Drop all cached entries (call after any mutating CLI command)."""
+        self._entries.clear()
+
+
+class SingleFlight:
+    """Deduplicate concurrent identical CLI fetches.
+
+    If the dashboard fires two requests for the same key while one fetch is
+    already in flight, the second awaits the first's result instead of
+    spawning a second subprocess against the node.
+    """
+
+    def __init__(self):
+        self._inflight = {}
+
+    async def run(self, key, fetch):
+        """Await the in-flight fetch for key, or start one in a thread."""
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.create_task(asyncio.to_thread(fetch))
+            self._inflight[key] = task
+            task.add_done_callback(lambda _t: self._inflight.pop(key, None))
+        # Shield so one caller disconnecting doesn't cancel the shared fetch
+        return await asyncio.shield(task)
+
+
+cli_cache = CLICache(ttl=3.0)
+single_flight = SingleFlight()
+
+# Latest get_status result, refreshed by a background task so page loads
+# never wait on the CLI round-trip
+status_cache = {"value": None}
+
+STATUS_REFRESH_INTERVAL = 3.0
+
+
+async def _status_loop():
+    """Refresh the shared status snapshot every few seconds."""
+    while True:
+        try:
+            status_cache["value"] = await asyncio.to_thread(cli.get_status)
+        except Exception:
+            # Keep serving the last good snapshot; next tick retries
+            pass
+        await asyncio.sleep(STATUS_REFRESH_INTERVAL)
+
+
+@app.before_serving
+async def start_status_refresher():
+    app.status_task = asyncio.create_task(_status_loop())
+
+
+@app.before_serving
+async def warm_templates():
+    """Compile all templates up front so first renders skip parse + stat calls."""
+    if not app.debug:
+        app.jinja_env.auto_reload = False
+        app.config["TEMPLATES_AUTO_RELOAD"] = False
+    for name in ("base.html", "dashboard.html", "create_wallet.html",
+                 "import_wallet.html", "manage_wallets.html",
+                 "send_transaction.html", "transactions.html"):
+        app.jinja_env.get_template(name)
+
+
+@app.after_serving
+async def stop_status_refresher():
+    app.status_task.cancel()
+
+
+async def get_cached_status():
+    """Return the background-refreshed status, fetching once if not warm yet."""
+    status = status_cache["value"]
+    if status is None:
+        status = await cli_cache.get("get_status", cli.get_status)
+    return status
+
 
 @app.route("/")
-def index():
+async def index():
     """Home page / Dashboard."""
     try:
-        status = cli.get_status()
+        status = await get_cached_status()
         context = {
             "node_connected": status["connected"],
             "error": status.get("error"),
             "addresses": status.get("master_addresses", [])
         }
-        return render_template("dashboard.html", **context)
+        return await render_template("dashboard.html", **context)
     except Exception as e:
-        return render_template("dashboard.html", node_connected=False, error=str(e))
+        return await render_template("dashboard.html", node_connected=False, error=str(e))
 
 
 @app.route("/api/status")
-def api_status():
+async def api_status():
     """Get wallet and node status."""
     try:
-        status = cli.get_status()
-        return jsonify({
+        status = await get_cached_status()
+        return ojson_cached({
             "success": True,
             "connected": status["connected"],
             "addresses": status.get("master_addresses", []),
             "error": status.get("error")
         })
     except Exception as e:
-        return jsonify({
+        return ojson({
             "success": False,
             "error": str(e),
             "connected": False
-        }), 500
+        }, 500)
 
 
 @app.route("/create-wallet")
-def create_wallet():
+async def create_wallet():
     """Create wallet page."""
-    return render_template("create_wallet.html")
+    return await render_template("create_wallet.html")
 
 
 @app.route("/api/create-wallet", methods=["POST"])
-def api_create_wallet():
+async def api_create_wallet():
     """API endpoint to create a new wallet."""
-    try:
-        result = cli.generate_keypair()
-        return jsonify({
-            "success": True,
-            "message": "New wallet created!",
-            "data": result
-        })
-    except NockchainCLIError as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 400
-    except Exception as e:
-        return jsonify({
-            "success": False,
-            "error": f"Unexpected error: {str(e)}"
-        }), 500
+    result = await asyncio.to_thread(cli.generate_keypair)
+    cli_cache.invalidate()
+    return ojson({
+        "success": True,
+        "message": "New wallet created!",
+        "data": result
+    })
 
 
 @app.route("/import-wallet")
-def import_wallet():
+async def import_wallet():
     """Import wallet page."""
-    return render_template("import_wallet.html")
+    return await render_template("import_wallet.html")
 
 
 @app.route("/api/import-wallet", methods=["POST"])
-def api_import_wallet():
+async def api_import_wallet():
     """API endpoint to import a wallet."""
-    try:
-        data = request.get_json()
-
-        if not data:
-            return jsonify({"success": False, "error": "No data provided"}), 400
-
-        seed_phrase = data.get("seed_phrase")
-        key_file = data.get("key_file")
-        version = data.get("version", "1")  # Default to version 1
-
-        if not seed_phrase and not key_file:
-            return jsonify({
-                "success": False,
-                "error": "Please provide either a seed phrase or key file"
-            }), 400
-
-        # Validate version - only 0 or 1 allowed
-        if version not in ["0", "1", 0, 1]:
-            return jsonify({
-                "success": False,
-                "error": "Invalid version. Version must be 0 or 1."
-            }), 400
-
-        result = cli.import_keys(seed_phrase=seed_phrase, key_file=key_file, version=str(version))
-
-        return jsonify({
-            "success": result.get("success", True),
-            "message": result.get("message", "Wallet imported successfully!"),
-            "address": result.get("address", ""),
-            "data": result.get("data", {})
-        })
-    except NockchainCLIError as e:
-        return jsonify({
+    data = await request.get_json()
+
+    if not data:
+        return error_response("No data provided")
+
+    seed_phrase = data.get("seed_phrase")
+    key_file = data.get("key_file")
+    version = data.get("version", "1")  # Default to version 1
+
+    if not seed_phrase and not key_file:
+        return ojson({
             "success": False,
-            "error": str(e)
-        }), 400
-    except Exception as e:
-        return jsonify({
+            "error": "Please provide either a seed phrase or key file"
+        }, 400)
+
+    # Validate version - only 0 or 1 allowed
+    if str(version) not in ("0", "1"):
+        return ojson({
             "success": False,
-            "error": f"Unexpected error: {str(e)}"
-        }), 500
+            "error": "Invalid version. Version must be 0 or 1."
+        }, 400)
+
+    result = await asyncio.to_thread(
+        cli.import_keys, seed_phrase=seed_phrase, key_file=key_file, version=str(version)
+    )
+    cli_cache.invalidate()
+
+    return ojson({
+        "success": result.get("success", True),
+        "message": result.get("message", "Wallet imported successfully!"),
+        "address": result.get("address", ""),
+        "data": result.get("data", {})
+    })
 
 
 @app.route("/transactions")
-def transactions():
+async def transactions():
     """View transactions page."""
-    return render_template("transactions.html")
+    return await render_template("transactions.html")
 
 
 @app.route("/api/transactions")
-def api_transactions():
+async def api_transactions():
     """Get all transactions (notes) for the active wallet."""
-    try:
-        # Get active address using list-active-addresses
-        try:
-            active_addresses_output = cli._run_command("list-active-addresses")
-            active_data = parse_list_active_addresses(active_addresses_output)
-            active_address = active_data.get("address", "")
-        except:
-            # Fallback to list-master-addresses
-            addresses_data = cli.list_master_addresses()
-            active_address = addresses_data.get("active_address", "")
-        
-        if not active_address:
-            return jsonify({
-                "success": False,
-                "error": "No active wallet found"
-            }), 400
-        
-        # Get notes for the active address only
-        notes_data = cli.list_notes_by_address(active_address)
-        
-        return jsonify({
-            "success": True,
-            "address": active_address,
-            "total_balance_nock": notes_data.get("total_balance_nock", 0),
-            "total_balance_nicks": notes_data.get("total_balance_nicks", 0),
-            "notes": notes_data.get("notes", [])
-        })
-    except Exception as e:
-        return jsonify({
+    # Fire the active-address lookup and its fallback in parallel so the
+    # fallback answer is already in hand if the primary fails
+    active_result, fallback_result = await asyncio.gather(
+        cli_cache.get("list-active-addresses", lambda: cli._run_command("list-active-addresses")),
+        cli_cache.get("list_master_addresses", cli.list_master_addresses),
+        return_exceptions=True
+    )
+
+    active_address = ""
+    if not isinstance(active_result, Exception):
+        active_data = parse_list_active_addresses(active_result)
+        active_address = active_data.get("address", "")
+    if not active_address and not isinstance(fallback_result, Exception):
+        # Fallback to list-master-addresses
+        active_address = fallback_result.get("active_address", "")
+
+    if not active_address:
+        return ojson({
             "success": False,
-            "error": str(e)
-        }), 500
+            "error": "No active wallet found"
+        }, 400)
+
+    # Get notes for the active address only (shared across concurrent polls)
+    try:
+        notes_data = await single_flight.run(
+            f"notes:{active_address}", lambda: cli.list_notes_by_address(active_address)
+        )
+        await asyncio.to_thread(notes_store.ingest, active_address, notes_data.get("notes", []))
+    except NockchainCLIError:
+        # CLI/node unavailable: fall back to the last ingested snapshot
+        if not await asyncio.to_thread(notes_store.has_notes, active_address):
+            raise
+        notes_data = await asyncio.to_thread(notes_store.notes_for_address, active_address)
+
+    summary = {
+        "success": True,
+        "address": active_address,
+        "total_balance_nock": notes_data.get("total_balance_nock", 0),
+        "total_balance_nicks": notes_data.get("total_balance_nicks", 0)
+    }
+    # ?summary=1 lets balance polls skip serializing the full note list
+    if request.args.get("summary"):
+        return ojson_cached(summary)
+
+    # Stream the note list one element at a time: bytes hit the wire
+    # immediately and we never hold the fully encoded blob in memory
+    notes = notes_data.get("notes", [])
+
+    async def generate():
+        yield orjson.dumps(summary)[:-1] + b',"notes":['
+        for i, note in enumerate(notes):
+            yield (b"," if i else b"") + orjson.dumps(note)
+        yield b"]}"
+
+    return app.response_class(generate(), mimetype="application/json")
 
 
 @app.route("/send")
-def send():
+async def send():
     """Send transaction page."""
     try:
-        addresses = cli.list_active_addresses()
-        return render_template("send_transaction.html", addresses=addresses)
+        addresses = await cli_cache.get("list_active_addresses", cli.list_active_addresses)
+        return await render_template("send_transaction.html", addresses=addresses)
     except Exception as e:
-        return render_template("send_transaction.html", addresses=[], error=str(e))
+        return await render_template("send_transaction.html", addresses=[], error=str(e))
 
 
 @app.route("/manage-wallets")
-def manage_wallets():
+async def manage_wallets():
     """Manage wallets page."""
-    return render_template("manage_wallets.html")
+    return await render_template("manage_wallets.html")
 
 
 @app.route("/api/send-transaction", methods=["POST"])
-def api_send_transaction():
+async def api_send_transaction():
     """API endpoint to send a transaction."""
-    try:
-        data = request.get_json()
+    data = await request.get_json()
 
-        if not data:
-            return jsonify({"success": False, "error": "No data provided"}), 400
+    if not data:
+        return error_response("No data provided")
 
-        sender = data.get("sender")
-        recipient = data.get("recipient")
-        amount_nock = data.get("amount")
-        fee_nock = data.get("fee", 0.00001)  # Default small fee
+    sender = data.get("sender")
+    recipient = data.get("recipient")
+    amount_nock = data.get("amount")
+    fee_nock = data.get("fee", 0.00001)  # Default small fee
 
-        if not all([sender, recipient, amount_nock]):
-            return jsonify({
-                "success": False,
-                "error": "Missing required fields: sender, recipient, amount"
-            }), 400
+    if not all([sender, recipient, amount_nock]):
+        return ojson({
+            "success": False,
+            "error": "Missing required fields: sender, recipient, amount"
+        }, 400)
 
-        # Validate addresses
-        if not isinstance(sender, str) or len(sender) < 10:
-            return jsonify({"success": False, "error": "Invalid sender address"}), 400
+    # Validate addresses
+    if not (isinstance(sender, str) and ADDR_RE.match(sender)):
+        return ojson({"success": False, "error": "Invalid sender address"}, 400)
 
-        if not isinstance(recipient, str) or len(recipient) < 10:
-            return jsonify({"success": False, "error": "Invalid recipient address"}), 400
+    if not (isinstance(recipient, str) and ADDR_RE.match(recipient)):
+        return ojson({"success": False, "error": "Invalid recipient address"}, 400)
 
-        try:
-            amount_nicks = nock_to_nicks(float(amount_nock))
-            fee_nicks = nock_to_nicks(float(fee_nock))
-        except ValueError:
-            return jsonify({
-                "success": False,
-                "error": "Invalid amount or fee format"
-            }), 400
-
-        # Create transaction
-        tx_result = cli.create_transaction(
-            pubkey=sender,
-            recipient=recipient,
-            amount=amount_nicks,
-            fee=fee_nicks
-        )
+    try:
+        amount_nicks = nock_to_nicks(amount_nock)
+        fee_nicks = nock_to_nicks(fee_nock)
+    except ValueError:
+        return ojson({
+            "success": False,
+            "error": "Invalid amount or fee format"
+        }, 400)
 
-        # Send transaction
-        send_result = cli.send_transaction(tx_result)
+    # Create transaction
+    tx_result = await asyncio.to_thread(
+        cli.create_transaction,
+        pubkey=sender,
+        recipient=recipient,
+        amount=amount_nicks,
+        fee=fee_nicks
+    )
 
-        return jsonify({
-            "success": True,
-            "message": "Transaction sent successfully!",
-            "data": send_result
-        })
-    except NockchainCLIError as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 400
-    except Exception as e:
-        return jsonify({
-            "success": False,
-            "error": f"Unexpected error: {str(e)}"
-        }), 500
+    # Send transaction
+    send_result = await asyncio.to_thread(cli.send_transaction, tx_result)
+    cli_cache.invalidate()
+
+    return ojson({
+        "success": True,
+        "message": "Transaction sent successfully!",
+        "data": send_result
+    })
 
 
 @app.route("/api/addresses")
-def api_addresses():
+async def api_addresses():
     """Get list of active addresses."""
-    try:
-        addresses = cli.list_active_addresses()
-        return jsonify({
-            "success": True,
-            "addresses": addresses
-        })
-    except NockchainCLIError as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 400
+    addresses = await cli_cache.get("list_active_addresses", cli.list_active_addresses)
+    return ojson_cached({
+        "success": True,
+        "addresses": addresses
+    })
 
 
 @app.route("/api/active-wallet")
-def api_active_wallet():
+async def api_active_wallet():
     """Get active wallet address and balance using show-balance."""
-    try:
-        # Get active address first
-        addresses_data = cli.list_master_addresses()
-        active_address = addresses_data.get("active_address", "")
-        
-        if not active_address:
-            return jsonify({
-                "success": False,
-                "error": "No active wallet found"
-            }), 400
-        
-        # Get balance from show-balance command
-        balance_info = cli.show_balance()
-        
-        return jsonify({
-            "success": True,
-            "address": active_address,
-            "balance_nock": balance_info.get("balance_nock", 0),
-            "balance_nicks": balance_info.get("balance_nicks", 0),
-            "block_height": balance_info.get("block_height", ""),
-            "num_notes": balance_info.get("num_notes", 0),
-            "version": balance_info.get("version", "")
-        })
-    except Exception as e:
-        return jsonify({
+    # The address lookup and balance query are independent subprocesses,
+    # so run them concurrently instead of back-to-back
+    addresses_data, balance_info = await asyncio.gather(
+        cli_cache.get("list_master_addresses", cli.list_master_addresses),
+        cli_cache.get("show_balance", cli.show_balance)
+    )
+    active_address = addresses_data.get("active_address", "")
+
+    if not active_address:
+        return ojson({
             "success": False,
-            "error": str(e)
-        }), 500
+            "error": "No active wallet found"
+        }, 400)
+
+    return _etag_response(_balance_encoder.encode(BalanceResponse(
+        success=True,
+        address=active_address,
+        balance_nock=balance_info.get("balance_nock", 0),
+        balance_nicks=balance_info.get("balance_nicks", 0),
+        block_height=balance_info.get("block_height", ""),
+        num_notes=balance_info.get("num_notes", 0),
+        version=balance_info.get("version", "")
+    )))
 
 
 @app.route("/api/refresh-balance", methods=["POST"])
-def api_refresh_balance():
+async def api_refresh_balance():
     """Refresh the balance for the active wallet."""
-    try:
-        active_address = cli.get_active_master_address()
-        if not active_address:
-            return jsonify({
-                "success": False,
-                "error": "No active wallet found to refresh balance."
-            }), 400
+    # An explicit refresh must bypass cached results and drop stale ones
+    cli_cache.invalidate()
+    active_address = await asyncio.to_thread(cli.get_active_master_address)
+    if not active_address:
+        return ojson({
+            "success": False,
+            "error": "No active wallet found to refresh balance."
+        }, 400)
 
-        # Get fresh balance from show-balance
-        balance_info = cli.show_balance()
+    # Get fresh balance from show-balance (shared across concurrent refreshes)
+    balance_info = await single_flight.run("show_balance", cli.show_balance)
 
-        return jsonify({
-            "success": True,
-            "address": active_address,
-            "balance_nock": balance_info.get("balance_nock", 0),
-            "balance_nicks": balance_info.get("balance_nicks", 0),
-            "block_height": balance_info.get("block_height", ""),
-            "num_notes": balance_info.get("num_notes", 0)
-        })
-    except NockchainCLIError as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 400
-    except Exception as e:
-        return jsonify({
-            "success": False,
-            "error": f"Unexpected error: {str(e)}"
-        }), 500
+    return app.response_class(_balance_encoder.encode(BalanceResponse(
+        success=True,
+        address=active_address,
+        balance_nock=balance_info.get("balance_nock", 0),
+        balance_nicks=balance_info.get("balance_nicks", 0),
+        block_height=balance_info.get("block_height", ""),
+        num_notes=balance_info.get("num_notes", 0)
+    )), mimetype="application/json")
 
 
 @app.route("/api/wallets")
-def api_wallets():
+async def api_wallets():
     """Get list of all wallets."""
-    try:
-        addresses_data = cli.list_master_addresses()
-        return jsonify({
-            "success": True,
-            "active_address": addresses_data.get("active_address", ""),
-            "wallets": addresses_data.get("addresses", [])
-        })
-    except Exception as e:
-        return jsonify({
-            "success": False,
-            "error": str(e)
-        }), 500
+    addresses_data = await cli_cache.get("list_master_addresses", cli.list_master_addresses)
+    return ojson_cached({
+        "success": True,
+        "active_address": addresses_data.get("active_address", ""),
+        "wallets": addresses_data.get("addresses", [])
+    })
 
 
 @app.route("/api/set-active-wallet", methods=["POST"])
-def api_set_active_wallet():
+async def api_set_active_wallet():
     """Set the active wallet address."""
-    try:
-        data = request.get_json()
-        
-        if not data:
-            return jsonify({"success": False, "error": "No data provided"}), 400
-        
-        address = data.get("address")
-        
-        if not address:
-            return jsonify({
-                "success": False,
-                "error": "Address is required"
-            }), 400
-        
-        # Set the active wallet
-        cli.set_active_master_address(address)
-        
-        return jsonify({
-            "success": True,
-            "message": "Active wallet updated successfully!",
-            "address": address
-        })
-    except Exception as e:
-        return jsonify({
+    data = await request.get_json()
+
+    if not data:
+        return error_response("No data provided")
+
+    address = data.get("address")
+
+    if not address:
+        return ojson({
             "success": False,
-            "error": str(e)
-        }), 500
+            "error": "Address is required"
+        }, 400)
+
+    # Set the active wallet
+    await asyncio.to_thread(cli.set_active_master_address, address)
+    cli_cache.invalidate()
+
+    return ojson({
+        "success": True,
+        "message": "Active wallet updated successfully!",
+        "address": address
+    })
+
+
+@app.errorhandler(NockchainCLIError)
+async def handle_cli_error(e):
+    """Surface CLI failures as 400s with the CLI's message."""
+    return ojson({"success": False, "error": str(e)}, 400)
+
+
+@app.errorhandler(Exception)
+async def handle_unexpected_error(e):
+    """Catch-all for bugs and environment failures."""
+    if isinstance(e, HTTPException):
+        return e
+    return ojson({"success": False, "error": f"Unexpected error: {str(e)}"}, 500)
 
 
 @app.errorhandler(404)
-def not_found(e):
+async def not_found(e):
     """Handle 404 errors."""
-    return jsonify({"error": "Not found"}), 404
+    return ojson({"error": "Not found"}, 404)
 
 
 @app.errorhandler(500)
-def server_error(e):
+async def server_error(e):
     """Handle 500 errors."""
-    return jsonify({"error": "Server error"}), 500
+    return ojson({"error": "Server error"}, 500)
 
 
 if __name__ == "__main__":
@@ -1,10 +1,76 @@
 import subprocess
 import json
+import sys
 import os
 import re
+import threading
+from decimal import Decimal, InvalidOperation
+from functools import lru_cache
+from io import StringIO
+from operator import itemgetter
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple, Any
 
+# nockchain-wallet is a one-shot binary (no stdin/stdout protocol), so we
+# can't keep warm workers around. Instead, cap how many CLI processes run
+# at once so a burst of requests queues briefly rather than spawning an
+# unbounded number of processes and thrashing the node connection.
+_MAX_CONCURRENT_CLI = int(os.environ.get("NOCKCHAIN_CLI_MAX_CONCURRENCY", "10"))
+_cli_slots = threading.BoundedSemaphore(_MAX_CONCURRENT_CLI)
+
+# Wall-clock cap on any single CLI invocation, captured or streamed
+_CLI_TIMEOUT = 30
+
+# Ask the CLI for plain output so the ANSI-strip pass short-circuits on
+# its no-escapes fast path instead of running a regex over every capture
+_CLI_ENV = {**os.environ, "NO_COLOR": "1", "TERM": "dumb"}
+
+# Patterns shared by the parsers below, compiled once at import time instead
+# of per call
+# CSI sequences (colors etc.) are virtually all the CLI ever emits; match
+# them without the alternation so the engine never branches per escape
+_ANSI_CSI_RE = re.compile(r'\x1B\[[0-?]*[ -/]*[@-~]')
+# Full pattern kept as a fallback for the rare non-CSI escapes
+_ANSI_RE = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
+_DIGITS_RE = re.compile(r'(\d+)')
+# All show-balance fields folded into one alternation so the whole output
+# is scanned in a single pass instead of per-line searches ('h2' catches a
+# height that appears without the block-hash header form)
+_BALANCE_FIELDS_RE = re.compile(
+    r'from block\s+(?P<bh>\S+)\s+at(?:\s+height\s+(?P<h>[\d.]+))?'
+    r'|at height\s+(?P<h2>[\d.]+)'
+    r'|(?:- )?Wallet Version:\s*(?P<v>\S+)'
+    r'|Number of Notes:\s*(?P<n>\d+)'
+    r'|Balance:\s*(?P<b>\d+)\s+nicks'
+)
+
+
+def _bracket_contents(text: str) -> Optional[str]:
+    """Contents of the first [...] pair in text, or None.
+
+    Two str.find calls plus a slice; cheaper than a regex search for the
+    one-per-note name lines where this runs.
+    """
+    start = text.find('[')
+    if start == -1:
+        return None
+    end = text.find(']', start + 1)
+    if end == -1:
+        return None
+    return text[start + 1:end]
+
+# Line prefixes the parsers skip, checked with one C-level startswith call
+# instead of a chain of Python-level branches
+_LOG_PREFIXES = ("I ", "[")
+_NOTE_BREAK_PREFIXES = ("I ", "[", "―")
+# Separator/header lines that terminate a multi-line address block
+_ADDRESS_STOP_PREFIXES = ("―", "Master")
+
+# Log/noise lines in list-active-addresses output, folded into one compiled
+# alternation so the filter is a single C-level match per line (".?I "
+# preserves the old "I " in line[:3] check on stripped lines)
+_LOG_LINE_RE = re.compile(r'^(?:\[|.?I |.*kernel:|.*nockchain)')
+
 
 class NockchainCLIError(Exception):
     """Custom exception for nockchain-wallet CLI errors."""
@@ -21,8 +87,48 @@ def strip_ansi_codes(text: str) -> str:
     Returns:
         Clean text without ANSI codes
     """
-    ansi_escape = re.compile(r'\x1B(?:[@-Z\\-_]|\[[0-?]*[ -/]*[@-~])')
-    return ansi_escape.sub('', text)
+    # Most piped CLI output has no escapes at all; a C-level membership
+    # check is far cheaper than running the regex over the whole string
+    if '\x1b' not in text:
+        return text
+    text = _ANSI_CSI_RE.sub('', text)
+    if '\x1b' in text:
+        # Something non-CSI slipped through; run the full pattern
+        text = _ANSI_RE.sub('', text)
+    return text
+
+
+def _iter_clean_lines(text: str):
+    """
+    Yield stripped lines from ANSI-cleaned CLI output, skipping log noise.
+
+    Blank lines and log lines ("I (..)" and "[kernel..]") are dropped.
+    Lines come from a StringIO wrapper, which scans lazily instead of
+    materializing the whole line list up front.
+    """
+    for raw_line in StringIO(text):
+        line = raw_line.strip()
+        if not line or line.startswith(_LOG_PREFIXES):
+            continue
+        yield line
+
+
+@lru_cache(maxsize=32)
+def _strip_ansi_cached(text: str) -> str:
+    return strip_ansi_codes(text)
+
+
+def _strip_ansi_small(text: str) -> str:
+    """strip_ansi_codes with memoization for small inputs.
+
+    The status poll re-fetches address listings every few seconds and the
+    CLI output is usually byte-identical between polls; a tiny LRU keyed
+    on the raw text skips the re-scan. Large outputs bypass the cache so
+    it never pins big strings in memory.
+    """
+    if len(text) <= 4096:
+        return _strip_ansi_cached(text)
+    return strip_ansi_codes(text)
 
 
 def parse_keygen_output(output: str) -> Dict[str, str]:
@@ -48,15 +154,17 @@ def parse_keygen_output(output: str) -> Dict[str, str]:
         "raw_output": clean_output
     }
 
-    # Split by lines
-    lines = clean_output.split('\n')
+    # Split once and strip each line once; the look-ahead scans below can
+    # then index the pre-stripped list directly
+    lines = clean_output.splitlines()
+    stripped = [l.strip() for l in lines]
 
     i = 0
     while i < len(lines):
-        line = lines[i].strip()
+        line = stripped[i]
 
         # Skip empty lines and log lines
-        if not line or line.startswith("I ") or line.startswith("["):
+        if not line or line.startswith(_LOG_PREFIXES):
             i += 1
             continue
 
@@ -64,10 +172,10 @@ def parse_keygen_output(output: str) -> Dict[str, str]:
         if line == "Address":
             # Next non-empty line should be the address
             j = i + 1
-            while j < len(lines) and not lines[j].strip():
+            while j < len(lines) and not stripped[j]:
                 j += 1
             if j < len(lines):
-                result["address"] = lines[j].strip()
+                result["address"] = stripped[j]
             i = j
             continue
 
@@ -76,8 +184,8 @@ def parse_keygen_output(output: str) -> Dict[str, str]:
             j = i + 1
             private_key_lines = []
             while j < len(lines):
-                next_line = lines[j].strip()
-                if not next_line or "Extended Public Key" in lines[j]:
+                next_line = stripped[j]
+                if not next_line or "Extended Public Key" in next_line:
                     break
                 private_key_lines.append(next_line)
                 j += 1
@@ -90,8 +198,8 @@ def parse_keygen_output(output: str) -> Dict[str, str]:
             j = i + 1
             public_key_lines = []
             while j < len(lines):
-                next_line = lines[j].strip()
-                if not next_line or "Seed Phrase" in lines[j]:
+                next_line = stripped[j]
+                if not next_line or "Seed Phrase" in next_line:
                     break
                 public_key_lines.append(next_line)
                 j += 1
@@ -104,8 +212,8 @@ def parse_keygen_output(output: str) -> Dict[str, str]:
             j = i + 1
             seed_lines = []
             while j < len(lines):
-                next_line = lines[j].strip()
-                if not next_line or "Version" in lines[j]:
+                next_line = stripped[j]
+                if not next_line or "Version" in next_line:
                     break
                 # Remove quotes if present
                 next_line = next_line.strip("'\"")
@@ -118,10 +226,10 @@ def parse_keygen_output(output: str) -> Dict[str, str]:
         # Parse Version (look for "Version" with following line having the number)
         if line.startswith("Version"):
             j = i + 1
-            while j < len(lines) and not lines[j].strip():
+            while j < len(lines) and not stripped[j]:
                 j += 1
             if j < len(lines):
-                version_line = lines[j].strip()
+                version_line = stripped[j]
                 # Version could be on the same line or next line
                 if version_line and version_line[0].isdigit():
                     result["version"] = version_line
@@ -158,21 +266,9 @@ def parse_import_output(output: str) -> Dict[str, str]:
         "raw_output": clean_output
     }
 
-    # Split by lines
-    lines = clean_output.split('\n')
-
-    i = 0
-    while i < len(lines):
-        line = lines[i].strip()
-
-        # Skip empty lines and log lines
-        if not line or line.startswith("I ") or line.startswith("["):
-            i += 1
-            continue
-
+    for line in _iter_clean_lines(clean_output):
         # Skip header lines
-        if "Master Key (Imported)" in line or "Master Key" in line:
-            i += 1
+        if "Master Key" in line:
             continue
 
         # Extract Address
@@ -187,8 +283,6 @@ def parse_import_output(output: str) -> Dict[str, str]:
             if version and version.isdigit():
                 result["version"] = version
 
-        i += 1
-
     return result
 
 
@@ -216,11 +310,7 @@ def parse_show_master_pubkey_output(output: str) -> Dict[str, str]:
         "version": ""
     }
 
-    lines = clean_output.split('\n')
-
-    for line in lines:
-        line = line.strip()
-
+    for line in _iter_clean_lines(clean_output):
         # Extract Extended Public Key
         if line.startswith("- Extended Public Key:"):
             key = line.replace("- Extended Public Key:", "").strip()
@@ -247,127 +337,90 @@ def parse_show_master_pubkey_output(output: str) -> Dict[str, str]:
 def parse_list_master_addresses(output: str) -> Dict[str, Any]:
     """
     Parse nockchain-wallet list-master-addresses output.
-    
+
+    Single forward pass: each line is stripped and examined once, instead
+    of the nested look-ahead scans that re-visited lines already consumed.
+
     Returns:
         Dictionary with active address and all addresses with versions
     """
-    clean_output = strip_ansi_codes(output)
-    
+    clean_output = _strip_ansi_small(output)
+
     result = {
         "active_address": "",
         "addresses": []
     }
-    
-    lines = clean_output.split('\n')
-    i = 0
-    
-    while i < len(lines):
-        line = lines[i].strip()
-        
-        # Extract Address
+
+    current = None  # record under construction
+
+    def _flush():
+        if current is None:
+            return
+        address = "".join(current["parts"]).replace("(active)", "").strip()
+        if address:
+            entry = {
+                "address": address,
+                "version": current["version"] or "1",
+                "is_active": current["is_active"]
+            }
+            result["addresses"].append(entry)
+            if entry["is_active"]:
+                result["active_address"] = address
+
+    for raw_line in clean_output.splitlines():
+        line = raw_line.strip()
+
         if line.startswith("- Address:"):
-            address_part = line.split("- Address:", 1)[1].strip()
-            
-            # Collect multi-line addresses
-            # If address is empty on first line, collect from next lines
-            if not address_part:
-                j = i + 1
-                address_lines = []
-                active_marker_found = False
-                
-                while j < len(lines):
-                    next_line = lines[j].strip()
-                    
-                    # Stop at version line or separator
-                    if next_line.startswith("- Version:") or next_line.startswith("―"):
-                        break
-                    
-                    # Stop at next address
-                    if next_line.startswith("- Address:"):
-                        break
-                    
-                    # Check for "(active)" marker on its own line
-                    if next_line == "(active)":
-                        active_marker_found = True
-                        break
-                    
-                    # Stop at empty lines followed by separator
-                    if not next_line:
-                        # Check if next non-empty line is a version or separator
-                        k = j + 1
-                        while k < len(lines) and not lines[k].strip():
-                            k += 1
-                        if k < len(lines):
-                            peek_line = lines[k].strip()
-                            if peek_line.startswith("- Version:") or peek_line.startswith("―"):
-                                break
-                        j += 1
-                        continue
-                    
-                    # Add line to address (this line contains the address part)
-                    address_lines.append(next_line)
-                    j += 1
-                
-                address_part = "".join(address_lines)
-                
-                # If we found (active) marker on separate line, mark it
-                if active_marker_found:
-                    is_active = True
-                else:
-                    is_active = False
-            else:
-                # Check if address is on same line as marker
-                is_active = "(active)" in address_part
-            
-            # Clean the address by removing (active) marker
-            address = address_part.replace("(active)", "").strip()
-            
-            # Also check if the next line is just "(active)" for single-line addresses
-            if not is_active and address_part and i + 1 < len(lines):
-                next_line = lines[i + 1].strip()
-                if next_line == "(active)":
-                    is_active = True
-            
-            # Look for version on next non-empty lines (skip separator lines)
-            version = "1"  # default
-            j = i + 1
-            while j < len(lines):
-                next_line = lines[j].strip()
-                
-                # Skip separator lines (em dashes or many dashes)
-                if next_line.startswith("―") or (next_line.startswith("-") and not next_line.startswith("- ")):
-                    j += 1
-                    continue
-                
-                # Skip empty lines
-                if not next_line:
-                    j += 1
-                    continue
-                
-                # Found version line
-                if next_line.startswith("- Version:"):
-                    version = next_line.split("- Version:", 1)[1].strip()
-                    break
-                
-                # If we hit another address or section, stop looking
-                if next_line.startswith("- Address:") or next_line.startswith("Master"):
-                    break
-                
-                j += 1
-            
-            # Only add if we have an address
-            if address:
-                result["addresses"].append({
-                    "address": address,
-                    "version": version,
-                    "is_active": is_active
-                })
-                
-                if is_active:
-                    result["active_address"] = address
-        
-        i += 1
-    
+            _flush()
+            part = line.split("- Address:", 1)[1].strip()
+            current = {
+                "parts": [],
+                "is_active": False,
+                "version": "",
+                # Multi-line addresses (empty remainder) keep collecting lines
+                "collecting": not part,
+                # For single-line addresses, "(active)" may sit on the next line
+                "check_active_next": bool(part),
+            }
+            if part:
+                current["is_active"] = "(active)" in part
+                current["parts"].append(part.replace("(active)", "").strip())
+            continue
+
+        if current is None:
+            continue
+
+        if current["check_active_next"]:
+            current["check_active_next"] = False
+            if line == "(active)":
+                current["is_active"] = True
+                continue
+
+        if not line:
+            continue
+
+        # Version line closes out address collection
+        if line.startswith("- Version:"):
+            if not current["version"]:
+                current["version"] = line.split("- Version:", 1)[1].strip()
+            current["collecting"] = False
+            continue
+
+        # Separators and section headers also end collection
+        if line.startswith(_ADDRESS_STOP_PREFIXES):
+            current["collecting"] = False
+            continue
+
+        if line == "(active)":
+            if current["collecting"]:
+                current["is_active"] = True
+                current["collecting"] = False
+            continue
+
+        if current["collecting"]:
+            current["parts"].append(line)
+
+    _flush()
     return result
 
 
@@ -391,7 +444,7 @@ def parse_list_active_addresses(output: str) -> Dict[str, str]:
         Dictionary with address, version, and type (Signing or Watch only)
     """
     # Strip ANSI codes
-    clean_output = strip_ansi_codes(output)
+    clean_output = _strip_ansi_small(output)
 
     # Initialize result dictionary
     result = {
@@ -401,28 +454,19 @@ def parse_list_active_addresses(output: str) -> Dict[str, str]:
         "raw_output": clean_output
     }
 
-    # Split by lines
-    lines = clean_output.split('\n')
-
     current_type = ""
-    i = 0
-    while i < len(lines):
-        line = lines[i].strip()
-
-        # Skip empty lines and log lines
-        if not line or line.startswith("I ") or line.startswith("[") or line.startswith("―"):
-            i += 1
+    for line in _iter_clean_lines(clean_output):
+        # Skip separator lines
+        if line.startswith("―"):
             continue
 
         # Check for section headers
         if "Addresses -- Signing" in line:
             current_type = "Signing"
-            i += 1
             continue
 
         if "Addresses -- Watch only" in line:
             current_type = "Watch only"
-            i += 1
             continue
 
         # Extract Address (only from Signing section)
@@ -438,8 +482,6 @@ def parse_list_active_addresses(output: str) -> Dict[str, str]:
             if version and version.isdigit():
                 result["version"] = version
 
-        i += 1
-
     return result
 
 
@@ -472,7 +514,7 @@ def parse_list_notes_by_address(output: str) -> Dict[str, Any]:
     clean_output = strip_ansi_codes(output)
     notes = []
     
-    lines = clean_output.split('\n')
+    lines = clean_output.splitlines()
     
     current_note = None
     i = 0
@@ -480,9 +522,10 @@ def parse_list_notes_by_address(output: str) -> Dict[str, Any]:
         line = lines[i].strip()
         
         # Skip empty lines, log lines, and separator lines
-        if not line or line.startswith("I ") or line.startswith("[") or line.startswith("―"):
+        if not line or line.startswith(_NOTE_BREAK_PREFIXES):
             # If we have a current note with all fields, save it
             if current_note and 'source' in current_note:
+                current_note.setdefault('assets_nicks', 0)
                 notes.append(current_note)
                 current_note = None
             i += 1
@@ -496,38 +539,33 @@ def parse_list_notes_by_address(output: str) -> Dict[str, Any]:
         # Parse note name
         if line.startswith('- Name:'):
             if current_note and 'source' in current_note:
+                current_note.setdefault('assets_nicks', 0)
                 notes.append(current_note)
             
             current_note = {}
             # Extract name: "- Name: [address note_id]"
-            match = re.search(r'\[(.*?)\]', line)
-            if match:
-                current_note['name'] = match.group(1)
+            name = _bracket_contents(line)
+            if name is not None:
+                current_note['name'] = name
             i += 1
             continue
         
         # Parse version
         if current_note and line.startswith('- Version:'):
             version_str = line.replace('- Version:', '').strip()
-            current_note['version'] = version_str
+            current_note['version'] = sys.intern(version_str)
             i += 1
             continue
         
         # Parse assets
         if current_note and line.startswith('- Assets:'):
-            match = re.search(r'(\d+)', line)
-            if match:
-                assets_nicks = int(match.group(1))
-                current_note['assets_nicks'] = assets_nicks
-                current_note['assets_nock'] = nicks_to_nock(assets_nicks)
+            _note_set_assets(current_note, line.partition(':')[2].strip())
             i += 1
             continue
         
         # Parse block height
         if current_note and line.startswith('- Block Height:'):
-            match = re.search(r'(\d+)', line)
-            if match:
-                current_note['block_height'] = match.group(1)
+            _note_set_block_height(current_note, line.partition(':')[2].strip())
             i += 1
             continue
         
@@ -542,10 +580,11 @@ def parse_list_notes_by_address(output: str) -> Dict[str, Any]:
     
     # Don't forget the last note
     if current_note and 'source' in current_note:
+        current_note.setdefault('assets_nicks', 0)
         notes.append(current_note)
     
     # Calculate total balance
-    total_nicks = sum(note.get('assets_nicks', 0) for note in notes)
+    total_nicks = sum(map(itemgetter('assets_nicks'), notes))
     total_nock = nicks_to_nock(total_nicks)
     
     return {
@@ -566,18 +605,69 @@ def parse_list_notes(output: str) -> Tuple[str, List[Dict[str, Any]]]:
         Tuple of (active_address, list of notes)
         Each note contains: name, version, assets, block_height, source
     """
-    clean_output = strip_ansi_codes(output)
+    return _parse_note_stream(output.splitlines())
+
+
+def _note_set_version(note: Dict[str, Any], value: str) -> None:
+    # Versions repeat across every note in a wallet; interning makes the
+    # thousands of copies share one string object
+    note['version'] = sys.intern(value)
+
+
+def _note_set_assets(note: Dict[str, Any], value: str) -> None:
+    # "65536 nicks" -> take the leading token and let int() do the work;
+    # the regex scan only runs for unexpected layouts
+    token = value.split(None, 1)[0] if value else ''
+    if not token.isdigit():
+        match = _DIGITS_RE.search(value)
+        if not match:
+            return
+        token = match.group(1)
+    assets_nicks = int(token)
+    note['assets_nicks'] = assets_nicks
+    note['assets_nock'] = nicks_to_nock(assets_nicks)
+
+
+def _note_set_block_height(note: Dict[str, Any], value: str) -> None:
+    token = value.split(None, 1)[0] if value else ''
+    if token.isdigit():
+        note['block_height'] = token
+    else:
+        match = _DIGITS_RE.search(value)
+        if match:
+            note['block_height'] = match.group(1)
+
+
+def _note_set_source(note: Dict[str, Any], value: str) -> None:
+    note['source'] = value
+
+
+# Field label -> setter; one dict lookup replaces the startswith cascade
+_NOTE_FIELD_HANDLERS = {
+    '- Version': _note_set_version,
+    '- Assets': _note_set_assets,
+    '- Block Height': _note_set_block_height,
+    '- Source': _note_set_source,
+}
+
+
+def _parse_note_stream(lines) -> List[Dict[str, Any]]:
+    """Parse list-notes formatted lines from any iterable.
+
+    Accepts a list from splitlines() or a generator reading subprocess
+    output incrementally, so large listings never need the full raw
+    output held in memory at once.
+    """
     notes = []
     current_note = None
-    
-    lines = clean_output.split('\n')
-    
+
     for line in lines:
-        line_stripped = line.strip()
+        line_stripped = strip_ansi_codes(line).strip()
         
         # Skip empty lines and separator lines
         if not line_stripped or line_stripped.startswith('―'):
             if current_note and 'source' in current_note:
+                current_note.setdefault('assets_nicks', 0)
                 notes.append(current_note)
                 current_note = None
             continue
@@ -586,56 +676,58 @@ def parse_list_notes(output: str) -> Tuple[str, List[Dict[str, Any]]]:
         if 'Wallet Notes' in line_stripped or 'Details' in line_stripped or 'Lock' in line_stripped:
             continue
         
+        label, sep, value = line_stripped.partition(':')
+
         # Parse note name
-        if line_stripped.startswith('- Name:'):
+        if label == '- Name' and sep:
             if current_note and 'source' in current_note:
+                current_note.setdefault('assets_nicks', 0)
                 notes.append(current_note)
-            
+
             current_note = {}
             # Extract name: "- Name: [address note_name]"
-            match = re.search(r'\[(.*?)\]', line_stripped)
-            if match:
-                current_note['name'] = match.group(1)
-        
-        # Parse version
-        elif current_note and line_stripped.startswith('- Version:'):
-            version_str = line_stripped.replace('- Version:', '').strip()
-            current_note['version'] = version_str
-        
-        # Parse assets
-        elif current_note and line_stripped.startswith('- Assets:'):
-            match = re.search(r'(\d+)', line_stripped)
-            if match:
-                assets_nicks = int(match.group(1))
-                current_note['assets_nicks'] = assets_nicks
-                current_note['assets_nock'] = nicks_to_nock(assets_nicks)
-        
-        # Parse block height
-        elif current_note and line_stripped.startswith('- Block Height:'):
-            match = re.search(r'(\d+)', line_stripped)
-            if match:
-                current_note['block_height'] = match.group(1)
-        
-        # Parse source (transaction ID)
-        elif current_note and line_stripped.startswith('- Source:'):
-            source = line_stripped.replace('- Source:', '').strip()
-            current_note['source'] = source
-    
+            name = _bracket_contents(line_stripped)
+            if name is not None:
+                current_note['name'] = name
+
+        # Parse remaining fields via handler lookup
+        elif current_note and sep:
+            handler = _NOTE_FIELD_HANDLERS.get(label)
+            if handler:
+                handler(current_note, value.strip())
+
     # Don't forget the last note
     if current_note and 'source' in current_note:
+        current_note.setdefault('assets_nicks', 0)
         notes.append(current_note)
     
     return notes
 
 
+NICKS_PER_NOCK = 65536
+# 2**-16 is exact in binary floating point, so multiplying by the hoisted
+# reciprocal gives bit-identical results to dividing by 65536
+_NOCK_PER_NICK = 1.0 / NICKS_PER_NOCK
+
+
 def nicks_to_nock(nicks: int) -> float:
     """Convert nicks to NOCK."""
-    return nicks / 65536
+    return nicks * _NOCK_PER_NICK
+
+
+def nock_to_nicks(nock) -> int:
+    """Convert NOCK to nicks using exact decimal arithmetic.
 
+    Accepts int, float, or string amounts. Going through Decimal avoids
+    IEEE-754 rounding on user-entered amounts before they reach the CLI.
 
-def nock_to_nicks(nock: float) -> int:
-    """Convert NOCK to nicks."""
-    return int(nock * 65536)
+    Raises:
+        ValueError: If the amount is not a valid number
+    """
+    try:
+        return int(Decimal(str(nock)) * NICKS_PER_NOCK)
+    except InvalidOperation:
+        raise ValueError(f"Invalid NOCK amount: {nock!r}")
 
 
 class NockchainWalletCLI:
@@ -651,6 +743,92 @@ class NockchainWalletCLI:
         """
         self.private_grpc_port = private_grpc_port
         self.public_grpc_addr = public_grpc_addr
+        # address -> (raw CLI output, parsed notes) for unchanged-output reuse
+        self._notes_parse_cache: Dict[str, Tuple[str, Dict[str, Any]]] = {}
+        # (raw CLI output, parsed result) for unchanged master-address polls
+        self._master_parse_cache: Optional[Tuple[str, Dict[str, Any]]] = None
+
+    def _iter_command_lines(self, *args):
+        """
+        Run a nockchain-wallet command and yield its stdout line by line.
+
+        Streams output through a pipe instead of buffering the whole
+        capture, so line-oriented parsers can start work immediately and
+        memory stays flat for large listings. The generator must be
+        consumed fully; a non-zero exit raises once stdout is drained.
+        A watchdog kills the process at the usual wall-clock cap, and
+        stderr is drained concurrently so a chatty child cannot fill its
+        pipe and deadlock against the stdout reads.
+
+        Args:
+            *args: Command arguments to pass to nockchain-wallet
+
+        Yields:
+            Decoded output lines (including trailing newlines)
+
+        Raises:
+            NockchainCLIError: If command fails or times out
+        """
+        cmd = ["nockchain-wallet"] + list(args)
+
+        try:
+            with _cli_slots:
+                proc = subprocess.Popen(
+                    cmd,
+                    stdout=subprocess.PIPE,
+                    stderr=subprocess.PIPE,
+                    bufsize=1 << 20,
+                    env=_CLI_ENV,
+                )
+
+                stderr_chunks = []
+
+                def _drain_stderr():
+                    stderr_chunks.append(proc.stderr.read())
+
+                stderr_thread = threading.Thread(target=_drain_stderr, daemon=True)
+                stderr_thread.start()
+
+                # Killing the process on expiry forces EOF on stdout, so a
+                # binary that stalls mid-stream cannot hang the consumer
+                # (or pin a semaphore slot) past the deadline
+                timed_out = threading.Event()
+
+                def _expire():
+                    timed_out.set()
+                    proc.kill()
+
+                watchdog = threading.Timer(_CLI_TIMEOUT, _expire)
+                watchdog.start()
+                try:
+                    for raw_line in proc.stdout:
+                        yield raw_line.decode("utf-8", "replace")
+                    returncode = proc.wait()
+                finally:
+                    watchdog.cancel()
+                    if proc.poll() is None:
+                        proc.kill()
+                        proc.wait()
+                    stderr_thread.join()
+                    proc.stdout.close()
+                    proc.stderr.close()
+
+            if timed_out.is_set():
+                raise NockchainCLIError(
+                    f"Command timed out after {_CLI_TIMEOUT} seconds."
+                )
+
+            if returncode != 0:
+                stderr = b"".join(stderr_chunks).decode("utf-8", "replace")
+                raise NockchainCLIError(
+                    f"Command failed: {' '.join(cmd)}\n"
+                    f"Error: {stderr}"
+                )
+
+        except FileNotFoundError:
+            raise NockchainCLIError(
+                "nockchain-wallet not found. Please ensure it's installed and in your PATH."
+            )
 
     def _run_command(self, *args) -> str:
         """
@@ -668,27 +846,36 @@ class NockchainWalletCLI:
         cmd = ["nockchain-wallet"] + list(args)
 
         try:
-            result = subprocess.run(
-                cmd,
-                capture_output=True,
-                text=True,
-                timeout=30,
-            )
+            with _cli_slots:
+                # Large reader buffer: big note listings arrive with far
+                # fewer read() syscalls than the 8 KiB default allows
+                result = subprocess.run(
+                    cmd,
+                    capture_output=True,
+                    timeout=_CLI_TIMEOUT,
+                    bufsize=1 << 20,
+                    env=_CLI_ENV,
+                )
 
             if result.returncode != 0:
                 raise NockchainCLIError(
                     f"Command failed: {' '.join(cmd)}\n"
-                    f"Error: {result.stderr}"
+                    f"Error: {result.stderr.decode('utf-8', 'replace')}"
                 )
 
-            return result.stdout.strip()
+            # Capture raw bytes and decode exactly once here; text=True would
+            # add a universal-newlines pass and stderr gets decoded only on
+            # the error path.
+            return result.stdout.decode("utf-8", "replace").strip()
 
         except FileNotFoundError:
             raise NockchainCLIError(
                 "nockchain-wallet not found. Please ensure it's installed and in your PATH."
             )
         except subprocess.TimeoutExpired:
-            raise NockchainCLIError("Command timed out after 30 seconds.")
+            raise NockchainCLIError(
+                f"Command timed out after {_CLI_TIMEOUT} seconds."
+            )
         except Exception as e:
             raise NockchainCLIError(f"Unexpected error: {str(e)}")
 
@@ -711,7 +898,16 @@ class NockchainWalletCLI:
             Dictionary with active_address and list of addresses with versions
         """
         output = self._run_command("list-master-addresses")
-        return parse_list_master_addresses(output)
+
+        # Status polling re-fetches this every few seconds; skip the parse
+        # when the raw output is byte-identical to the previous call
+        cached = self._master_parse_cache
+        if cached and cached[0] == output:
+            return cached[1]
+
+        parsed = parse_list_master_addresses(output)
+        self._master_parse_cache = (output, parsed)
+        return parsed
 
     def list_active_addresses(self) -> List[str]:
         """
@@ -728,10 +924,10 @@ class NockchainWalletCLI:
         # Parse output to get list of addresses
         # Filter out log lines and empty lines
         addresses = []
-        for line in clean_output.split("\n"):
+        for line in clean_output.splitlines():
             line = line.strip()
             # Skip empty lines and log lines
-            if not line or line.startswith("[") or "kernel:" in line or "nockchain" in line or "I " in line[:3]:
+            if not line or _LOG_LINE_RE.match(line):
                 continue
             addresses.append(line)
         
@@ -868,18 +1064,20 @@ class NockchainWalletCLI:
             import_result["data"] = parsed_data
             import_result["message"] = "Wallet imported successfully!"
             
-            # For key file imports, the CLI automatically sets it as active
-            # So we call list-active-addresses to get the address that was just set
-            try:
-                active_addresses_output = self._run_command("list-active-addresses")
-                active_data = parse_list_active_addresses(active_addresses_output)
-                if active_data.get("address"):
-                    import_result["address"] = active_data["address"]
-                    import_result["version"] = active_data.get("version", "")
-            except Exception as e:
-                # If we can't get active addresses, use parsed data
-                import_result["address"] = parsed_data.get("address", "")
-                import_result["version"] = parsed_data.get("version", "")
+            # The import output already prints the imported Master Key
+            # address, so use it directly and only spawn a second
+            # list-active-addresses call if the parse came up empty
+            import_result["address"] = parsed_data.get("address", "")
+            import_result["version"] = parsed_data.get("version", "")
+            if not import_result["address"]:
+                try:
+                    active_addresses_output = self._run_command("list-active-addresses")
+                    active_data = parse_list_active_addresses(active_addresses_output)
+                    if active_data.get("address"):
+                        import_result["address"] = active_data["address"]
+                        import_result["version"] = active_data.get("version", "")
+                except Exception:
+                    pass
             
         else:
             raise ValueError("Either seed_phrase or key_file must be provided")
@@ -956,52 +1154,47 @@ class NockchainWalletCLI:
             output = self._run_command("show-balance")
             clean_output = strip_ansi_codes(output)
             
-            result = {
-                "balance_nicks": 0,
-                "balance_nock": 0.0,
-                "block_height": "",
-                "num_notes": 0,
-                "version": "",
-                "block_hash": ""
+            balance_nicks = 0
+            block_height = ""
+            num_notes = 0
+            wallet_version = ""
+            block_hash = ""
+
+            # One linear scan of the whole output; each match sets the
+            # field named by whichever alternative fired. Fields collect
+            # in locals and the result dict is built once at the end.
+            for m in _BALANCE_FIELDS_RE.finditer(clean_output):
+                value = m.group("bh")
+                if value is not None:
+                    block_hash = value
+                    value = m.group("h")
+                    if value:
+                        block_height = value
+                    continue
+                value = m.group("h2")
+                if value is not None:
+                    block_height = value
+                    continue
+                value = m.group("v")
+                if value is not None:
+                    wallet_version = value
+                    continue
+                value = m.group("n")
+                if value is not None:
+                    num_notes = int(value)
+                    continue
+                value = m.group("b")
+                if value is not None:
+                    balance_nicks = int(value)
+
+            return {
+                "balance_nicks": balance_nicks,
+                "balance_nock": nicks_to_nock(balance_nicks),
+                "block_height": block_height,
+                "num_notes": num_notes,
+                "version": wallet_version,
+                "block_hash": block_hash
             }
-            
-            lines = clean_output.split('\n')
-            
-            for i, line in enumerate(lines):
-                line_stripped = line.strip()
-                
-                # Parse block height from header line
-                if "at height" in line_stripped:
-                    # Extract height from "... at height 38.999"
-                    match = re.search(r'at height\s+([\d.]+)', line_stripped)
-                    if match:
-                        result["block_height"] = match.group(1)
-                    
-                    # Extract block hash
-                    match = re.search(r'from block\s+(\S+)\s+at', line_stripped)
-                    if match:
-                        result["block_hash"] = match.group(1)
-                
-                # Parse wallet version
-                elif "Wallet Version:" in line_stripped:
-                    version = line_stripped.replace("- Wallet Version:", "").strip()
-                    result["version"] = version
-                
-                # Parse number of notes
-                elif "Number of Notes:" in line_stripped:
-                    match = re.search(r'(\d+)', line_stripped)
-                    if match:
-                        result["num_notes"] = int(match.group(1))
-                
-                # Parse balance in nicks
-                elif "Balance:" in line_stripped:
-                    match = re.search(r'(\d+)\s+nicks', line_stripped)
-                    if match:
-                        balance_nicks = int(match.group(1))
-                        result["balance_nicks"] = balance_nicks
-                        result["balance_nock"] = nicks_to_nock(balance_nicks)
-            
-            return result
         except Exception as e:
             raise NockchainCLIError(f"Failed to get balance: {str(e)}")
 
@@ -1018,11 +1211,12 @@ class NockchainWalletCLI:
             }
         """
         try:
-            output = self._run_command("list-notes")
-            notes = parse_list_notes(output)
-            
+            # Stream the listing straight from the subprocess pipe; notes
+            # are parsed as lines arrive instead of after a full capture.
+            notes = _parse_note_stream(self._iter_command_lines("list-notes"))
+
             # Calculate total balance
-            total_nicks = sum(note.get('assets_nicks', 0) for note in notes)
+            total_nicks = sum(map(itemgetter('assets_nicks'), notes))
             total_nock = nicks_to_nock(total_nicks)
             
             return {
@@ -1036,10 +1230,10 @@ class NockchainWalletCLI:
     def list_notes_by_address(self, address: str) -> Dict[str, Any]:
         """
         Get wallet notes for a specific address.
-        
+
         Args:
             address: The address to get notes for
-        
+
         Returns:
             Dictionary with:
             {
@@ -1050,6 +1244,15 @@ class NockchainWalletCLI:
         """
         try:
             output = self._run_command("list-notes-by-address", address)
-            return parse_list_notes_by_address(output)
+
+            # Repeated polls usually return byte-identical CLI output, so
+            # skip re-parsing when nothing changed for this address
+            cached = self._notes_parse_cache.get(address)
+            if cached and cached[0] == output:
+                return cached[1]
+
+            parsed = parse_list_notes_by_address(output)
+            self._notes_parse_cache[address] = (output, parsed)
+            return parsed
         except Exception as e:
             raise NockchainCLIError(f"Failed to list notes for address: {str(e)}")
@@ -0,0 +1,94 @@
+import sqlite3
+import threading
+from typing import Any, Dict, List
+
+from cli_integration import nicks_to_nock
+
+
+class NotesStore:
+    """SQLite-backed store of parsed wallet notes.
+
+    Ingesting each successful CLI fetch gives the transactions page a local
+    copy that can be queried in milliseconds (indexed SELECTs instead of a
+    subprocess) and keeps serving when the node or CLI is unavailable.
+    WAL mode lets readers proceed while an ingest batch commits.
+    """
+
+    def __init__(self, path: str = "notes_cache.db"):
+        self._conn = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """CREATE TABLE IF NOT EXISTS notes (
+                address TEXT NOT NULL,
+                name TEXT NOT NULL,
+                version TEXT,
+                assets_nicks INTEGER NOT NULL,
+                block_height TEXT,
+                source TEXT,
+                PRIMARY KEY (address, name)
+            )"""
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS idx_notes_address ON notes(address)"
+        )
+        self._conn.commit()
+
+    def ingest(self, address: str, notes: List[Dict[str, Any]]) -> None:
+        """Replace the stored notes for address with a freshly parsed batch."""
+        rows = [
+            (
+                address,
+                note.get("name", ""),
+                note.get("version", ""),
+                note.get("assets_nicks", 0),
+                note.get("block_height", ""),
+                note.get("source", ""),
+            )
+            for note in notes
+        ]
+        with self._lock:
+            self._conn.execute("BEGIN IMMEDIATE")
+            self._conn.execute("DELETE FROM notes WHERE address = ?", (address,))
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO notes VALUES (?, ?, ?, ?, ?, ?)", rows
+            )
+            self._conn.commit()
+
+    def notes_for_address(self, address: str) -> Dict[str, Any]:
+        """Return stored notes and totals for address, like list_notes_by_address."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "SELECT name, version, assets_nicks, block_height, source "
+                "FROM notes WHERE address = ?",
+                (address,),
+            )
+            rows = cursor.fetchall()
+
+        notes = [
+            {
+                "name": name,
+                "version": version,
+                "assets_nicks": assets_nicks,
+                "assets_nock": nicks_to_nock(assets_nicks),
+                "block_height": block_height,
+                "source": source,
+            }
+            for name, version, assets_nicks, block_height, source in rows
+        ]
+        total_nicks = sum(note["assets_nicks"] for note in notes)
+
+        return {
+            "notes": notes,
+            "total_balance_nicks": total_nicks,
+            "total_balance_nock": nicks_to_nock(total_nicks),
+        }
+
+    def has_notes(self, address: str) -> bool:
+        """Whether any notes are stored for address."""
+        with self._lock:
+            cursor = self._conn.execute(
+                "SELECT 1 FROM notes WHERE address = ? LIMIT 1", (address,)
+            )
+            return cursor.fetchone() is not None
@@ -0,0 +1,18 @@
+"""Production entry point: serve the app with Hypercorn workers.
+
+`python app.py` stays as the single-process dev server; this script runs
+one worker per CPU so concurrent wallet requests are spread across
+processes.
+"""
+import os
+
+from hypercorn.config import Config
+from hypercorn.run import run
+
+config = Config()
+config.application_path = "app:app"
+config.bind = [os.environ.get("KNOX_BIND", "127.0.0.1:5000")]
+config.workers = int(os.environ.get("KNOX_WORKERS", str(os.cpu_count() or 1)))
+
+if __name__ == "__main__":
+    run(config)